@@ -0,0 +1,3 @@
+"""Activity-driven revenue analytics pipeline."""
+
+__version__ = "0.1.0"
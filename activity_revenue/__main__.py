@@ -0,0 +1,3 @@
+from activity_revenue.cli import main
+
+main()
@@ -0,0 +1,387 @@
+# activity_revenue/cli.py
+#
+# Command-line entry point. Only the standard library (and the stdlib-only
+# validation module) is imported at module level; each subcommand imports
+# pandas, duckdb or catboost when it runs, so `--help` and lightweight
+# subcommands start quickly.
+
+import argparse
+import sys
+from pathlib import Path
+
+from activity_revenue.validation import (
+    DEFAULT_THRESHOLDS,
+    DataValidationError,
+    ValidationReport,
+)
+
+
+def _parse_threshold(value):
+    """
+    Parse a NAME=VALUE threshold override; VALUE "none" disables the check.
+    """
+    name, sep, limit = value.partition("=")
+    if not sep or name not in DEFAULT_THRESHOLDS:
+        raise argparse.ArgumentTypeError(
+            f"expected NAME=VALUE with NAME one of {', '.join(DEFAULT_THRESHOLDS)}"
+        )
+    if limit.lower() == "none":
+        return name, None
+    try:
+        return name, float(limit)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid threshold value: {limit!r}")
+
+
+def _finish_validation(report, report_path):
+    """
+    Write the validation report and fail the run if any threshold was exceeded.
+    """
+    report_path = Path(report_path)
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report.write_json(report_path)
+    print(f"\nValidation report saved to: {report_path}")
+    report.raise_for_failures()
+    print("All data validation checks passed")
+
+
+def _journal(args):
+    from activity_revenue.journal import process_journal_file
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    output = process_journal_file(args.input, output_path)
+
+    print(f"\nProcessing complete. Output saved to: {output_path}")
+    print("\nOutput Summary:")
+    print(output.describe())
+    print("\nFirst few rows of the output:")
+    print(output.head())
+    print(f"\nTotal number of Activity IDs processed: {len(output)}")
+
+
+def _tickets(args):
+    import pandas as pd
+
+    from activity_revenue.tickets import ENGINES
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    engine_options = {}
+    if args.engine == "duckdb":
+        engine_options = {
+            "memory_limit": args.duckdb_memory_limit,
+            "temp_directory": args.duckdb_temp_dir,
+        }
+
+    report = ValidationReport(dict(args.threshold))
+    final_df = ENGINES[args.engine](
+        args.tickets, args.journal, report=report, **engine_options
+    )
+
+    # Print summary statistics
+    print("\nSummary Statistics:")
+    print(final_df.describe())
+    print("\nFirst few rows of the final dataframe:")
+    print(final_df.head())
+
+    # Per geounit/month reconciliation against RPE revenue
+    if args.rpe is not None:
+        from activity_revenue.reconcile import preprocess_rpe_data, reconcile_revenue
+
+        rpe_df = preprocess_rpe_data(pd.read_csv(args.rpe))
+        report.record_rpe_reconciliation(reconcile_revenue(final_df, rpe_df))
+
+    # Only save once the checks pass, so downstream jobs never read a failed run
+    _finish_validation(report, args.validation_report)
+    final_df.to_csv(output_path, index=False)
+    print(f"\nProcessed tickets data saved to: {output_path}")
+
+
+def _export_matrices(args):
+    import pandas as pd
+
+    from activity_revenue.training_matrices import export_training_matrices
+
+    print("Loading processed tickets data...")
+    df = pd.read_csv(args.input, parse_dates=["Adjusted Date"])
+
+    print("Exporting training matrices...")
+    manifest = export_training_matrices(df, args.output_dir)
+    print(f"Training matrices saved to: {args.output_dir}")
+
+    print(f"\nRows exported: {manifest['n_rows']}")
+    print("Row ranges per geounit:")
+    for group, (start, stop) in manifest["groups"].items():
+        print(f"  {group}: rows {start}-{stop} ({stop - start} rows)")
+
+
+def _train(args):
+    from activity_revenue.model import (
+        save_model,
+        split_rows,
+        train_geounit_model,
+        train_model,
+    )
+    from activity_revenue.training_matrices import load_training_matrices
+
+    matrices = load_training_matrices(args.matrices)
+    exported = matrices["manifest"]["groups"]
+    unknown = [geounit for geounit in args.geounit or [] if geounit not in exported]
+    if unknown:
+        sys.exit(
+            f"Unknown geounit(s): {', '.join(unknown)}. "
+            f"Geounits in {args.matrices}: {', '.join(exported)}"
+        )
+
+    model_path = Path(args.model)
+    model_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if args.per_geounit:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Every worker memory-maps the same export and only copies its own rows
+        geounits = args.geounit or list(matrices["manifest"]["groups"])
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            futures = [
+                executor.submit(
+                    train_geounit_model,
+                    args.matrices,
+                    geounit,
+                    args.train_end,
+                    model_path.with_name(
+                        f"{model_path.stem}_{geounit}{model_path.suffix}"
+                    ),
+                )
+                for geounit in geounits
+            ]
+            for future in futures:
+                geounit, n_train, n_test = future.result()
+                print(f"{geounit}: trained on {n_train} rows, tested on {n_test} rows")
+        print(f"\nModels saved to: {model_path.parent}")
+        return
+
+    train_rows, test_rows = split_rows(matrices, args.train_end, args.geounit)
+    print(f"Train rows: {len(matrices['labels'][train_rows])}")
+    print(f"Test rows: {len(matrices['labels'][test_rows])}")
+
+    model = train_model(matrices, train_rows, test_rows)
+    save_model(model, model_path, matrices["manifest"])
+    print(f"\nModel saved to: {model_path}")
+
+
+def _score(args):
+    from activity_revenue.model import load_and_preprocess_data, load_model, score_data
+
+    model, manifest = load_model(args.model)
+    df = load_and_preprocess_data(args.input, geounits=args.geounit)
+    scored_df = score_data(model, manifest, df)
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    scored_df.to_csv(output_path, index=False)
+    print(f"Scored {len(scored_df)} rows, saved to: {output_path}")
+    print(f"Total predicted revenue: ${scored_df['Predicted'].sum():,.2f}")
+
+
+def _reconcile(args):
+    import pandas as pd
+
+    from activity_revenue.reconcile import preprocess_rpe_data, reconcile_revenue
+
+    tickets_df = pd.read_csv(args.tickets)
+    rpe_df = preprocess_rpe_data(pd.read_csv(args.rpe))
+    result = reconcile_revenue(tickets_df, rpe_df, start_date=args.start)
+
+    report = ValidationReport(dict(args.threshold))
+    report.record_rpe_reconciliation(result)
+
+    totals = result.groupby("Geounit")[["Tickets Revenue", "RPE Revenue"]].sum()
+    totals["Difference"] = totals["RPE Revenue"] - totals["Tickets Revenue"]
+    print("\nTotal Revenue Comparison Across All Geounits:")
+    print(totals.sort_values("Difference", ascending=False))
+
+    # Only save once the checks pass, so downstream jobs never read a failed run
+    _finish_validation(report, args.validation_report)
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    result.to_csv(output_path, index=False)
+    print(f"\nRevenue reconciliation saved to: {output_path}")
+
+
+def _add_threshold_argument(parser):
+    parser.add_argument(
+        "--threshold",
+        type=_parse_threshold,
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="Override a validation threshold ('none' disables it): "
+        + ", ".join(f"{name}={value}" for name, value in DEFAULT_THRESHOLDS.items()),
+    )
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="activity-revenue",
+        description="Activity-driven revenue data pipeline.",
+    )
+    parser.add_argument(
+        "--data-root",
+        type=Path,
+        default=Path.cwd(),
+        help="Project directory containing raw_data/ and processed_data/",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    journal = subparsers.add_parser("journal", help="Process journal operating time")
+    journal.add_argument("--input", help="Raw journal operating time CSV")
+    journal.add_argument("--output", help="Processed journal CSV")
+    journal.set_defaults(
+        func=_journal,
+        defaults={
+            "input": "raw_data/global_journal_operatingtime.csv",
+            "output": "processed_data/processed_journal_operatingtime.csv",
+        },
+    )
+
+    tickets = subparsers.add_parser("tickets", help="Process tickets data")
+    tickets.add_argument(
+        "--engine",
+        choices=["duckdb", "pandas"],
+        default="pandas",
+        help="Backend used for the ticket/journal transformations",
+    )
+    tickets.add_argument(
+        "--duckdb-memory-limit",
+        help="DuckDB memory limit, e.g. 8GB; DuckDB spills to disk beyond it",
+    )
+    tickets.add_argument(
+        "--duckdb-temp-dir", help="Directory DuckDB spills to when over the limit"
+    )
+    tickets.add_argument("--tickets", help="Raw tickets CSV or Parquet file")
+    tickets.add_argument("--journal", help="Processed journal CSV or Parquet file")
+    tickets.add_argument("--output", help="Processed tickets CSV")
+    tickets.add_argument(
+        "--rpe", help="Raw RPE revenue CSV to reconcile against per geounit/month"
+    )
+    tickets.add_argument("--validation-report", help="Validation report JSON")
+    _add_threshold_argument(tickets)
+    tickets.set_defaults(
+        func=_tickets,
+        defaults={
+            "tickets": "raw_data/global_tickets_wles_ops_data.csv",
+            "journal": "processed_data/processed_journal_operatingtime.csv",
+            "output": "processed_data/processed_tickets_wles_ops_data.csv",
+            "validation_report": "results/tickets_validation_report.json",
+        },
+    )
+
+    export_matrices = subparsers.add_parser(
+        "export-matrices", help="Export memory-mapped training matrices"
+    )
+    export_matrices.add_argument("--input", help="Processed tickets CSV")
+    export_matrices.add_argument("--output-dir", help="Directory for the .npy files")
+    export_matrices.set_defaults(
+        func=_export_matrices,
+        defaults={
+            "input": "processed_data/processed_tickets_wles_ops_data.csv",
+            "output_dir": "processed_data/training_matrices",
+        },
+    )
+
+    train = subparsers.add_parser("train", help="Train the CatBoost revenue model")
+    train.add_argument(
+        "--matrices", help="Training matrices directory written by export-matrices"
+    )
+    train.add_argument("--model", help="Where the trained model is saved")
+    train.add_argument(
+        "--train-end",
+        default="2023-12-31",
+        help="Last Adjusted Date in the training set; later rows are the test set",
+    )
+    train.add_argument(
+        "--geounit",
+        action="append",
+        help="Restrict training to this geounit (repeatable)",
+    )
+    train.add_argument(
+        "--per-geounit",
+        action="store_true",
+        help="Train one model per geounit, saved as <model>_<geounit>.joblib",
+    )
+    train.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for --per-geounit (default: one per CPU)",
+    )
+    train.set_defaults(
+        func=_train,
+        defaults={
+            "matrices": "processed_data/training_matrices",
+            "model": "models/catboost_revenue.joblib",
+        },
+    )
+
+    score = subparsers.add_parser("score", help="Score a batch with a trained model")
+    score.add_argument("--model", help="Trained model file")
+    score.add_argument("--input", help="Processed tickets CSV to score")
+    score.add_argument("--output", help="Scored CSV")
+    score.add_argument(
+        "--geounit",
+        action="append",
+        help="Only score this geounit (repeatable), e.g. with a per-geounit model",
+    )
+    score.set_defaults(
+        func=_score,
+        defaults={
+            "model": "models/catboost_revenue.joblib",
+            "input": "processed_data/processed_tickets_wles_ops_data.csv",
+            "output": "results/scored_tickets.csv",
+        },
+    )
+
+    reconcile = subparsers.add_parser(
+        "reconcile", help="Reconcile tickets revenue against RPE revenue"
+    )
+    reconcile.add_argument("--tickets", help="Processed tickets CSV")
+    reconcile.add_argument("--rpe", help="Raw RPE revenue CSV")
+    reconcile.add_argument("--output", help="Reconciliation CSV")
+    reconcile.add_argument(
+        "--start", default="2022-10-01", help="First month included"
+    )
+    reconcile.add_argument("--validation-report", help="Validation report JSON")
+    _add_threshold_argument(reconcile)
+    reconcile.set_defaults(
+        func=_reconcile,
+        defaults={
+            "tickets": "processed_data/processed_tickets_wles_ops_data.csv",
+            "rpe": "raw_data/global_rpe_revenue.csv",
+            "output": "results/revenue_reconciliation.csv",
+            "validation_report": "results/reconcile_validation_report.json",
+        },
+    )
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    # Paths not given on the command line default to locations under --data-root
+    for name, relative_path in args.defaults.items():
+        if getattr(args, name) is None:
+            setattr(args, name, args.data_root / relative_path)
+
+    try:
+        args.func(args)
+    except DataValidationError as e:
+        print(f"\n{e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
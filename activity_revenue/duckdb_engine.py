@@ -0,0 +1,282 @@
+# activity_revenue/duckdb_engine.py
+
+from pathlib import Path
+
+import duckdb
+import pandas as pd
+
+from activity_revenue.validation import NULL_CHECK_COLUMNS
+
+
+GROUPING_COLUMNS = [
+    "Adjusted Date",
+    "Sl Geounit (Code)",
+    "Country Name",
+    "Job Group code",
+    "Job Type code",
+    "Billing Account",
+    "Rig Name",
+    "Rig type",
+    "Rig environment",
+    "Well type",
+    "Well Operating Environment",
+]
+
+AGGREGATE_COLUMNS = [
+    "Unique_Well_Count",
+    "Tickets_Revenue",
+    "Operating Days",
+    "Operating_CellMonth",
+]
+
+# Ticket columns filled with "Unknown" by clean_data that the pipeline reads
+CATEGORICAL_COLUMNS = GROUPING_COLUMNS[1:] + ["Activity ID", "Well Name"]
+
+
+def _quote(column):
+    return '"' + column.replace('"', '""') + '"'
+
+
+def _literal(value):
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _source(path):
+    """
+    Table function reading a raw CSV or Parquet file in place.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".parquet":
+        return f"read_parquet({_literal(path)})"
+    return f"read_csv_auto({_literal(path)})"
+
+
+def _null_flag(column):
+    return _quote("null:" + column)
+
+
+def build_distributed_query(tickets_path, journal_path, null_columns=()):
+    """
+    Build the SQL equivalent of clean_data, preprocess_tickets_data and
+    merge_and_distribute_operating_days, producing one row per ticket.
+
+    Args:
+    tickets_path (str or Path): Raw tickets CSV or Parquet file
+    journal_path (str or Path): Processed journal CSV or Parquet file
+    null_columns (list): Raw columns to carry an is-null flag for, taken
+        before cleaning so the validation report can count them
+
+    Returns:
+    str: SQL query producing the ticket rows with distributed Operating Days
+    """
+    cleaned_columns = ",\n        ".join(
+        [
+            f"COALESCE(CAST({_quote(col)} AS VARCHAR), 'Unknown') AS {_quote(col)}"
+            for col in CATEGORICAL_COLUMNS
+        ]
+        + [f"{_quote(col)} IS NULL AS {_null_flag(col)}" for col in null_columns]
+    )
+
+    return f"""
+    WITH tickets AS (
+        SELECT
+        {cleaned_columns},
+        COALESCE("Field Ticket USD net value", 0) AS "Field Ticket USD net value",
+        CAST("Field Ticket Start Date" AS TIMESTAMP) AS start_date,
+        CAST("Field Ticket End Date" AS TIMESTAMP) AS end_date
+        FROM {_source(tickets_path)}
+    ),
+    adjusted AS (
+        -- Dates from the 26th onwards fall under the subsequent month
+        SELECT
+            *,
+            CAST(
+                CASE WHEN day(end_date) <= 25
+                THEN date_trunc('month', end_date)
+                ELSE date_trunc('month', end_date) + INTERVAL 1 MONTH
+                END AS DATE
+            ) AS "Adjusted Date"
+        FROM tickets
+    ),
+    merged AS (
+        SELECT adjusted.*, journal."Value" AS operating_days
+        FROM adjusted
+        LEFT JOIN (
+            SELECT CAST("Activity ID" AS VARCHAR) AS activity_id, "Value"
+            FROM {_source(journal_path)}
+        ) AS journal
+        ON adjusted."Activity ID" = journal.activity_id
+    )
+    SELECT
+        *,
+        operating_days
+            / COUNT(*) OVER (PARTITION BY "Activity ID") AS "Operating Days",
+        row_number() OVER (PARTITION BY "Activity ID") AS activity_row
+    FROM merged
+    """
+
+
+AGGREGATES = """
+        COUNT(DISTINCT "Well Name") AS "Unique_Well_Count",
+        SUM("Field Ticket USD net value") AS "Tickets_Revenue",
+        COALESCE(SUM("Operating Days"), 0) AS "Operating Days",
+        COALESCE(
+            SUM("Operating Days" / day(last_day("Adjusted Date"))), 0
+        ) AS "Operating_CellMonth"
+"""
+
+
+def build_tickets_query(tickets_path, journal_path):
+    """
+    Build the SQL equivalent of the full tickets transformation.
+
+    Args:
+    tickets_path (str or Path): Raw tickets CSV or Parquet file
+    journal_path (str or Path): Processed journal CSV or Parquet file
+
+    Returns:
+    str: SQL query producing the grouped tickets data
+    """
+    grouping_columns = ", ".join(_quote(col) for col in GROUPING_COLUMNS)
+
+    return f"""
+    SELECT
+        {grouping_columns},
+        {AGGREGATES}
+    FROM ({build_distributed_query(tickets_path, journal_path)}) AS distributed
+    WHERE "Adjusted Date" IS NOT NULL
+    GROUP BY {grouping_columns}
+    ORDER BY {grouping_columns}
+    """
+
+
+def build_checked_query(tickets_path, journal_path, null_columns):
+    """
+    Build the tickets transformation with the validation reductions computed
+    in the same aggregation. The reductions are per-group counts that add up
+    to the totals, so no extra pass over the ticket rows is needed. Rows with
+    a missing Adjusted Date form their own group; the caller drops it from the
+    grouped data after adding its counts to the totals.
+
+    Args:
+    tickets_path (str or Path): Raw tickets CSV or Parquet file
+    journal_path (str or Path): Processed journal CSV or Parquet file
+    null_columns (list): Raw ticket columns whose nulls are counted
+
+    Returns:
+    str: SQL query producing the grouped tickets data plus the check columns
+    """
+    grouping_columns = ", ".join(_quote(col) for col in GROUPING_COLUMNS)
+    null_counts = "".join(
+        f",\n        COUNT(*) FILTER (WHERE {_null_flag(col)}) AS {_null_flag(col)}"
+        for col in null_columns
+    )
+
+    return f"""
+    SELECT
+        {grouping_columns},
+        {AGGREGATES},
+        COUNT(*) AS rows,
+        COUNT(*) FILTER (WHERE end_date < start_date) AS invalid_date_ranges,
+        COUNT(*) FILTER (
+            WHERE start_date IS NULL OR end_date IS NULL
+        ) AS missing_dates,
+        COUNT(*) FILTER (WHERE operating_days IS NULL) AS rows_missing_journal,
+        -- Each missing activity is listed once, from its first ticket
+        COALESCE(
+            list("Activity ID") FILTER (
+                WHERE operating_days IS NULL AND activity_row = 1
+            ),
+            []
+        ) AS activity_ids_missing_journal{null_counts}
+    FROM ({build_distributed_query(tickets_path, journal_path, null_columns)})
+        AS distributed
+    GROUP BY {grouping_columns}
+    ORDER BY {grouping_columns}
+    """
+
+
+def process_tickets_duckdb(
+    tickets_path,
+    journal_path,
+    threads=None,
+    memory_limit=None,
+    temp_directory=None,
+    report=None,
+):
+    """
+    Run the tickets transformations as SQL in an embedded DuckDB database.
+    The raw files are scanned in place, so the data does not have to fit in RAM
+    and the joins and aggregations run on all cores.
+
+    Args:
+    tickets_path (str or Path): Raw tickets CSV or Parquet file
+    journal_path (str or Path): Processed journal CSV or Parquet file
+    threads (int): Number of DuckDB worker threads, defaults to all cores
+    memory_limit (str): DuckDB memory limit, e.g. "8GB"
+    temp_directory (str or Path): Where DuckDB spills when over the memory limit
+    report (ValidationReport): If given, the validation reductions are computed
+        in the same aggregation and recorded in it
+
+    Returns:
+    pd.DataFrame: Grouped tickets dataframe, identical in layout to
+    group_and_aggregate_tickets_data
+    """
+    con = duckdb.connect()
+    try:
+        if threads is not None:
+            con.execute(f"SET threads = {int(threads)}")
+        if memory_limit is not None:
+            con.execute(f"SET memory_limit = {_literal(memory_limit)}")
+        if temp_directory is not None:
+            con.execute(f"SET temp_directory = {_literal(temp_directory)}")
+
+        if report is None:
+            grouped_df = con.execute(
+                build_tickets_query(tickets_path, journal_path)
+            ).df()
+        else:
+            result_df = con.execute(
+                build_checked_query(tickets_path, journal_path, NULL_CHECK_COLUMNS)
+            ).df()
+    finally:
+        con.close()
+
+    if report is not None:
+        totals = result_df.drop(
+            columns=GROUPING_COLUMNS + ["activity_ids_missing_journal"]
+        ).sum()
+        report.record_nulls(
+            {col: totals["null:" + col] for col in NULL_CHECK_COLUMNS},
+            rows=totals["rows"],
+        )
+        report.record_date_ranges(
+            invalid=totals["invalid_date_ranges"],
+            missing=totals["missing_dates"],
+            rows=totals["rows"],
+        )
+        report.record_journal_matches(
+            missing_rows=totals["rows_missing_journal"],
+            missing_activity_ids=(
+                activity_id
+                for activity_ids in result_df["activity_ids_missing_journal"]
+                for activity_id in activity_ids
+            ),
+            rows=totals["rows"],
+        )
+
+        # Like the pandas groupby, drop tickets without an Adjusted Date; their
+        # revenue shows up in the revenue_difference check
+        grouped_df = result_df.loc[
+            result_df["Adjusted Date"].notna(), GROUPING_COLUMNS + AGGREGATE_COLUMNS
+        ].reset_index(drop=True)
+        report.record_revenue(
+            before=totals["Tickets_Revenue"], after=grouped_df["Tickets_Revenue"].sum()
+        )
+        report.record_zero_revenue(
+            zero_rows=(grouped_df["Tickets_Revenue"] == 0).sum(),
+            rows=len(grouped_df),
+        )
+
+    grouped_df["Adjusted Date"] = pd.to_datetime(grouped_df["Adjusted Date"])
+    return grouped_df
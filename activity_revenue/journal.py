@@ -1,4 +1,4 @@
-# utils/journal_data_preprocessing.py
+# activity_revenue/journal.py
 
 import pandas as pd
 
@@ -73,3 +73,24 @@ def preprocess_journal_data(df):
     result = result[["Geounit", "Activity ID", "OA Start", "OA End", "Value"]]
 
     return result
+
+
+def process_journal_file(input_file_path, output_file_path):
+    """
+    Process the raw journal operating time CSV and save the result.
+
+    Args:
+    input_file_path (str or Path): Raw journal operating time CSV
+    output_file_path (str or Path): Where the processed journal CSV is written
+
+    Returns:
+    pd.DataFrame: Processed dataframe with calculated values for each unique Activity ID
+    """
+    df = pd.read_csv(input_file_path)
+    result = preprocess_journal_data(df)
+
+    # Column order of the processed journal file
+    result = result[["Geounit", "Activity ID", "Value", "OA Start", "OA End"]]
+    result.to_csv(output_file_path, index=False)
+
+    return result
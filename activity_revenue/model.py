@@ -0,0 +1,176 @@
+# activity_revenue/model.py
+
+import numpy as np
+import pandas as pd
+
+from activity_revenue.training_matrices import (
+    CATEGORICAL_FEATURES,
+    date_split,
+    encode_features,
+    group_rows,
+    load_training_matrices,
+    to_feature_frame,
+)
+
+
+# Best hyperparameters found in notebooks/09_optimize_ml_model.ipynb
+BEST_PARAMS = {
+    "iterations": 383,
+    "learning_rate": 0.05332604907347196,
+    "depth": 5,
+    "l2_leaf_reg": 2.523755213829783e-06,
+    "bootstrap_type": "Bernoulli",
+    "subsample": 0.8737198107504663,
+}
+
+
+def load_and_preprocess_data(file_path, geounits=None):
+    """
+    Load the processed tickets data for scoring.
+
+    Args:
+    file_path (str or Path): Processed tickets CSV
+    geounits (list): Geounits to keep, or None for all
+
+    Returns:
+    pd.DataFrame: Tickets dataframe sorted by Adjusted Date
+    """
+    df = pd.read_csv(file_path, parse_dates=["Adjusted Date"])
+    df = df.sort_values("Adjusted Date")
+
+    if geounits:
+        df = df[df["Sl Geounit (Code)"].isin(geounits)]
+
+    df[CATEGORICAL_FEATURES] = df[CATEGORICAL_FEATURES].fillna("Unknown")
+
+    return df
+
+
+def split_rows(matrices, train_end, geounits=None):
+    """
+    Train and test rows of the exported matrices, split on train_end.
+    With a single geounit both are zero-copy slices of its row range.
+
+    Args:
+    matrices (dict): Output of load_training_matrices
+    train_end (str or pd.Timestamp): Last Adjusted Date in the training set
+    geounits (list): Geounits to keep, or None for all
+
+    Returns:
+    tuple: (train rows, test rows) as slices or index arrays
+    """
+    groups = geounits or list(matrices["manifest"]["groups"])
+    splits = [
+        date_split(matrices, train_end, group_rows(matrices, group))
+        for group in groups
+    ]
+    if len(splits) == 1:
+        return splits[0]
+
+    train_rows, test_rows = zip(*splits)
+    return (
+        np.concatenate([np.arange(rows.start, rows.stop) for rows in train_rows]),
+        np.concatenate([np.arange(rows.start, rows.stop) for rows in test_rows]),
+    )
+
+
+def train_model(matrices, train_rows, test_rows=None, params=None):
+    """
+    Train a CatBoost revenue model on rows of the exported training matrices.
+    Categorical features are passed as the export's integer codes.
+
+    Args:
+    matrices (dict): Output of load_training_matrices
+    train_rows (slice or np.ndarray): Training rows
+    test_rows (slice or np.ndarray): Evaluation rows used for early stopping, or None
+    params (dict): CatBoost parameters, defaults to BEST_PARAMS
+
+    Returns:
+    CatBoostRegressor: Fitted model
+    """
+    # Imported here so lightweight subcommands do not pay for catboost
+    from catboost import CatBoostRegressor
+
+    X_train, y_train, cat_features = to_feature_frame(matrices, train_rows)
+    params = dict(BEST_PARAMS if params is None else params)
+    params["cat_features"] = cat_features
+
+    model = CatBoostRegressor(**params)
+    fit_kwargs = {"verbose": 100}
+    if test_rows is not None:
+        X_test, y_test, _ = to_feature_frame(matrices, test_rows)
+        if len(X_test):
+            fit_kwargs["eval_set"] = (X_test, y_test)
+            fit_kwargs["early_stopping_rounds"] = 30
+    model.fit(X_train, y_train, **fit_kwargs)
+
+    return model
+
+
+def train_geounit_model(matrices_dir, geounit, train_end, model_path, params=None):
+    """
+    Train and save the model of a single geounit.
+    Meant to run in a worker process: each worker attaches to the same
+    memory-mapped matrices and only materialises its own geounit's rows.
+
+    Args:
+    matrices_dir (str or Path): Directory written by export_training_matrices
+    geounit (str): Geounit to train on
+    train_end (str): Last Adjusted Date in the training set
+    model_path (str or Path): Where the trained model is saved
+    params (dict): CatBoost parameters, defaults to BEST_PARAMS
+
+    Returns:
+    tuple: (geounit, number of training rows, number of test rows)
+    """
+    matrices = load_training_matrices(matrices_dir)
+    train_rows, test_rows = date_split(
+        matrices, train_end, group_rows(matrices, geounit)
+    )
+    model = train_model(matrices, train_rows, test_rows, params)
+    save_model(model, model_path, matrices["manifest"])
+    return (
+        geounit,
+        train_rows.stop - train_rows.start,
+        test_rows.stop - test_rows.start,
+    )
+
+
+def save_model(model, model_path, manifest):
+    """
+    Save a fitted model with joblib, together with the manifest of the
+    training matrices so scoring can encode categories the same way.
+    """
+    import joblib
+
+    joblib.dump({"model": model, "manifest": manifest}, model_path)
+
+
+def load_model(model_path):
+    """
+    Load a model saved with save_model.
+
+    Returns:
+    tuple: (model, manifest of the training matrices)
+    """
+    import joblib
+
+    saved = joblib.load(model_path)
+    return saved["model"], saved["manifest"]
+
+
+def score_data(model, manifest, df):
+    """
+    Predict revenue for the given rows.
+
+    Args:
+    model (CatBoostRegressor): Fitted model
+    manifest (dict): Manifest of the training matrices, from load_model
+    df (pd.DataFrame): Processed tickets rows to score
+
+    Returns:
+    pd.DataFrame: Copy of df with a "Predicted" column
+    """
+    df = df.copy()
+    df["Predicted"] = model.predict(encode_features(df, manifest))
+    return df
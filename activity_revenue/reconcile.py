@@ -0,0 +1,75 @@
+# activity_revenue/reconcile.py
+
+import pandas as pd
+
+
+def preprocess_rpe_data(df):
+    """
+    Preprocess the RPE revenue data.
+    Filters the data to include only WLES (Wireline Services) business line
+    and Service Revenue GL Account Category.
+
+    Args:
+    df (pd.DataFrame): Raw RPE revenue dataframe
+
+    Returns:
+    pd.DataFrame: Preprocessed RPE revenue dataframe for WLES and Service Revenue only
+    """
+    df = df.copy()
+    df["Month Date"] = pd.to_datetime(df["Month Date"])
+
+    # Filter for WLES business line and Service Revenue GL Account Category
+    df_filtered = df[
+        (df["SL Sub Business Line (Code)"] == "WLES")
+        & (df["GL Account Category"] == "Service Revenue")
+    ]
+
+    return df_filtered
+
+
+def reconcile_revenue(tickets_df, rpe_df, start_date="2022-10-01"):
+    """
+    Compare monthly tickets revenue against RPE service revenue per geounit.
+
+    Args:
+    tickets_df (pd.DataFrame): Processed tickets dataframe
+    rpe_df (pd.DataFrame): Preprocessed RPE revenue dataframe
+    start_date (str): First month included in the comparison
+
+    Returns:
+    pd.DataFrame: One row per geounit and month with both revenues and their difference
+    """
+    tickets_df = tickets_df.copy()
+    tickets_df["Adjusted Date"] = pd.to_datetime(tickets_df["Adjusted Date"])
+
+    tickets_monthly = (
+        tickets_df.groupby(
+            ["Sl Geounit (Code)", pd.Grouper(key="Adjusted Date", freq="MS")]
+        )["Tickets_Revenue"]
+        .sum()
+        .reset_index()
+    )
+    tickets_monthly.columns = ["Geounit", "Date", "Tickets Revenue"]
+
+    rpe_monthly = (
+        rpe_df.groupby(["SL Geounit (Code)", pd.Grouper(key="Month Date", freq="MS")])[
+            "RPE Revenue"
+        ]
+        .sum()
+        .reset_index()
+    )
+    rpe_monthly.columns = ["Geounit", "Date", "RPE Revenue"]
+
+    merged_df = pd.merge(
+        tickets_monthly, rpe_monthly, on=["Geounit", "Date"], how="outer"
+    ).fillna(0)
+    merged_df = merged_df[merged_df["Date"] >= pd.to_datetime(start_date)]
+
+    merged_df["Difference"] = merged_df["RPE Revenue"] - merged_df["Tickets Revenue"]
+    # Undefined (NaN) for months with no tickets revenue
+    merged_df["Difference %"] = (
+        merged_df["Difference"]
+        / merged_df["Tickets Revenue"].where(merged_df["Tickets Revenue"] != 0)
+    ) * 100
+
+    return merged_df.sort_values(["Geounit", "Date"]).reset_index(drop=True)
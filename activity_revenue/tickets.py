@@ -1,5 +1,8 @@
+# activity_revenue/tickets.py
+
 import pandas as pd
-from pathlib import Path
+
+from activity_revenue.validation import NULL_CHECK_COLUMNS
 
 
 def clean_data(df):
@@ -42,7 +45,12 @@ def adjust_month(date):
     """
     Adjust the month based on the specified criteria.
     Dates from the 26th onwards fall under the subsequent month.
+    The time of day is dropped so every ticket maps to midnight on the 1st.
+    Missing dates are returned unchanged (NaT).
     """
+    if pd.isna(date):
+        return date
+    date = date.normalize()
     if date.day <= 25:
         return date.replace(day=1)
     else:
@@ -50,27 +58,44 @@ def adjust_month(date):
         return next_month.replace(day=1)
 
 
-def preprocess_tickets_data(df):
+def preprocess_tickets_data(df, report=None):
     """
     Preprocess the tickets data.
+    Records date-range sanity (end >= start) in the validation report if given.
     """
     df = df.copy()
     df["Field Ticket Start Date"] = pd.to_datetime(df["Field Ticket Start Date"])
     df["Field Ticket End Date"] = pd.to_datetime(df["Field Ticket End Date"])
+    if report is not None:
+        start, end = df["Field Ticket Start Date"], df["Field Ticket End Date"]
+        report.record_date_ranges(
+            invalid=(end < start).sum(),
+            missing=(start.isna() | end.isna()).sum(),
+            rows=len(df),
+        )
     df["Adjusted Date"] = df["Field Ticket End Date"].apply(adjust_month)
     return df
 
 
-def merge_and_distribute_operating_days(tickets_df, journal_df):
+def merge_and_distribute_operating_days(tickets_df, journal_df, report=None):
     """
     Merge tickets data with journal data and distribute Operating Days.
     Also calculate Operating_CellMonth based on the number of days in each month.
+    Records Activity IDs missing from the journal in the validation report if given.
     """
     merged_df = pd.merge(
         tickets_df, journal_df[["Activity ID", "Value"]], on="Activity ID", how="left"
     )
     merged_df = merged_df.rename(columns={"Value": "Operating Days"})
 
+    if report is not None:
+        missing_journal = merged_df["Operating Days"].isna()
+        report.record_journal_matches(
+            missing_rows=missing_journal.sum(),
+            missing_activity_ids=merged_df.loc[missing_journal, "Activity ID"].unique(),
+            rows=len(merged_df),
+        )
+
     activity_counts = (
         merged_df.groupby("Activity ID").size().reset_index(name="Ticket_Count")
     )
@@ -87,13 +112,13 @@ def merge_and_distribute_operating_days(tickets_df, journal_df):
     return merged_df
 
 
-def group_and_aggregate_tickets_data(df):
+def group_and_aggregate_tickets_data(df, report=None):
     """
     Group and aggregate the tickets data based on specified columns.
+    Records revenue before and after grouping in the validation report if given.
     """
-    print(
-        f"Total revenue before grouping: ${df['Field Ticket USD net value'].sum():,.2f}"
-    )
+    revenue_before = df["Field Ticket USD net value"].sum()
+    print(f"Total revenue before grouping: ${revenue_before:,.2f}")
 
     grouping_columns = [
         "Adjusted Date",
@@ -122,15 +147,19 @@ def group_and_aggregate_tickets_data(df):
         .reset_index()
     )
 
-    print(
-        f"Total revenue after grouping: ${grouped_df['Field Ticket USD net value'].sum():,.2f}"
-    )
+    revenue_after = grouped_df["Field Ticket USD net value"].sum()
+    print(f"Total revenue after grouping: ${revenue_after:,.2f}")
 
-    zero_revenue_rows = grouped_df[grouped_df["Field Ticket USD net value"] == 0]
-    if not zero_revenue_rows.empty:
-        print(f"Warning: {len(zero_revenue_rows)} grouped rows have zero revenue")
+    zero_revenue = grouped_df["Field Ticket USD net value"] == 0
+    zero_revenue_count = zero_revenue.sum()
+    if zero_revenue_count:
+        print(f"Warning: {zero_revenue_count} grouped rows have zero revenue")
         print("Sample of zero revenue rows:")
-        print(zero_revenue_rows.head())
+        print(grouped_df[zero_revenue].head())
+
+    if report is not None:
+        report.record_revenue(before=revenue_before, after=revenue_after)
+        report.record_zero_revenue(zero_rows=zero_revenue_count, rows=len(grouped_df))
 
     grouped_df = grouped_df.rename(
         columns={
@@ -142,60 +171,71 @@ def group_and_aggregate_tickets_data(df):
     return grouped_df
 
 
-def main():
-    # Define file paths
-    project_root = Path(__file__).resolve().parents[1]
-    raw_tickets_path = project_root / "raw_data" / "global_tickets_wles_ops_data.csv"
-    processed_journal_path = (
-        project_root / "processed_data" / "processed_journal_operatingtime.csv"
-    )
-    output_path = (
-        project_root / "processed_data" / "processed_tickets_wles_ops_data.csv"
-    )
-
+def process_tickets_pandas(raw_tickets_path, processed_journal_path, report=None):
+    """
+    Run the tickets transformations in memory with pandas.
+    """
     # Load and clean raw tickets data
     print("Loading and cleaning raw tickets data...")
-    tickets_df = pd.read_csv(raw_tickets_path)
-    tickets_df = clean_data(tickets_df)
+    # Activity IDs are matched as text, as in the DuckDB engine, so numeric IDs
+    # with gaps (read as float) still match the journal
+    tickets_df = pd.read_csv(raw_tickets_path, dtype={"Activity ID": str})
 
-    print("NaN values after cleaning:")
-    print(tickets_df.isna().sum())
+    null_counts = tickets_df.isna().sum()
+    print("NaN values before cleaning:")
+    print(null_counts)
+    if report is not None:
+        report.record_nulls(null_counts[NULL_CHECK_COLUMNS], rows=len(tickets_df))
+
+    tickets_df = clean_data(tickets_df)
 
     # Preprocess tickets data
     print("\nPreprocessing tickets data...")
-    processed_tickets_df = preprocess_tickets_data(tickets_df)
+    processed_tickets_df = preprocess_tickets_data(tickets_df, report)
 
     # Load processed journal data
     print("Loading processed journal data...")
-    journal_df = pd.read_csv(processed_journal_path)
+    journal_df = pd.read_csv(processed_journal_path, dtype={"Activity ID": str})
 
     # Merge and distribute Operating Days
     print("Merging tickets data with journal data and distributing Operating Days...")
-    merged_df = merge_and_distribute_operating_days(processed_tickets_df, journal_df)
+    merged_df = merge_and_distribute_operating_days(
+        processed_tickets_df, journal_df, report
+    )
 
     # Group and aggregate the data
     print("\nGrouping and aggregating the data...")
-    final_df = group_and_aggregate_tickets_data(merged_df)
-
-    # Save the processed data
-    final_df.to_csv(output_path, index=False)
-    print(f"\nProcessed tickets data saved to: {output_path}")
-
-    # Print summary statistics
-    print("\nSummary Statistics:")
-    print(final_df.describe())
-    print("\nFirst few rows of the final dataframe:")
-    print(final_df.head())
-
-    # Additional analysis for APG Geounit in November 2022
-    apg_nov_2022 = final_df[
-        (final_df["Sl Geounit (Code)"] == "APG")
-        & (pd.to_datetime(final_df["Adjusted Date"]).dt.year == 2022)
-        & (pd.to_datetime(final_df["Adjusted Date"]).dt.month == 11)
-    ]
-    print("\nTotal revenue for APG Geounit in November 2022:")
-    print(f"${apg_nov_2022['Tickets_Revenue'].sum():,.2f}")
+    return group_and_aggregate_tickets_data(merged_df, report)
+
+
+def process_tickets_duckdb(
+    raw_tickets_path,
+    processed_journal_path,
+    report=None,
+    memory_limit=None,
+    temp_directory=None,
+):
+    """
+    Run the tickets transformations as SQL in an embedded DuckDB database.
+    """
+    # Imported here so the pandas engine does not require duckdb
+    from activity_revenue.duckdb_engine import process_tickets_duckdb as run_query
+
+    print("Running tickets transformations with DuckDB...")
+    final_df = run_query(
+        raw_tickets_path,
+        processed_journal_path,
+        memory_limit=memory_limit,
+        temp_directory=temp_directory,
+        report=report,
+    )
+    print(
+        f"Total revenue after grouping: ${final_df['Tickets_Revenue'].sum():,.2f}"
+    )
+    return final_df
 
 
-if __name__ == "__main__":
-    main()
+ENGINES = {
+    "pandas": process_tickets_pandas,
+    "duckdb": process_tickets_duckdb,
+}
@@ -0,0 +1,242 @@
+# activity_revenue/training_matrices.py
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+CATEGORICAL_FEATURES = [
+    "Sl Geounit (Code)",
+    "Country Name",
+    "Job Group code",
+    "Job Type code",
+    "Billing Account",
+    "Rig Name",
+    "Rig type",
+    "Rig environment",
+    "Well type",
+    "Well Operating Environment",
+]
+
+NUMERIC_FEATURES = ["Unique_Well_Count", "Operating Days", "Operating_CellMonth"]
+
+TARGET = "Tickets_Revenue"
+
+GROUP_COLUMN = "Sl Geounit (Code)"
+
+DATE_COLUMN = "Adjusted Date"
+
+MANIFEST_FILE = "manifest.json"
+
+ARRAY_FILES = {
+    "cat_codes": "cat_codes.npy",
+    "numeric": "numeric.npy",
+    "labels": "labels.npy",
+    "dates": "dates.npy",
+}
+
+
+def export_training_matrices(
+    df,
+    output_dir,
+    categorical_features=CATEGORICAL_FEATURES,
+    numeric_features=NUMERIC_FEATURES,
+    target=TARGET,
+    group_column=GROUP_COLUMN,
+    date_column=DATE_COLUMN,
+):
+    """
+    Write the encoded training matrices to .npy files that workers can memory-map.
+    Rows are sorted by group and date so every geounit is a contiguous row range,
+    which lets workers take zero-copy slices instead of fancy-indexed copies.
+
+    Args:
+    df (pd.DataFrame): Processed tickets dataframe (one row per grouped ticket cell)
+    output_dir (str or Path): Directory that receives the .npy files and manifest
+    categorical_features (list): Columns encoded as integer category codes
+    numeric_features (list): Columns stored as float64 features
+    target (str): Label column
+    group_column (str): Column used to build the per-group row ranges
+    date_column (str): Date column stored alongside the features for fold splits
+
+    Returns:
+    dict: The manifest describing the exported arrays
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    df = df.copy()
+    df[date_column] = pd.to_datetime(df[date_column])
+    df[categorical_features] = df[categorical_features].fillna("Unknown")
+    df = df.sort_values([group_column, date_column], kind="stable").reset_index(
+        drop=True
+    )
+
+    cat_codes = np.empty((len(df), len(categorical_features)), dtype=np.int32)
+    categories = {}
+    for i, feature in enumerate(categorical_features):
+        values = df[feature].astype("category")
+        cat_codes[:, i] = values.cat.codes
+        categories[feature] = values.cat.categories.astype(str).tolist()
+
+    arrays = {
+        "cat_codes": cat_codes,
+        "numeric": df[numeric_features].to_numpy(dtype=np.float64),
+        "labels": df[target].to_numpy(dtype=np.float64),
+        "dates": df[date_column].to_numpy(dtype="datetime64[ns]"),
+    }
+    for name, array in arrays.items():
+        np.save(output_dir / ARRAY_FILES[name], np.ascontiguousarray(array))
+
+    # Row ranges per group; the sort above guarantees each group is contiguous
+    groups = {}
+    if len(df):
+        group_values = df[group_column].astype(str).to_numpy()
+        boundaries = np.flatnonzero(group_values[1:] != group_values[:-1]) + 1
+        starts = np.concatenate(([0], boundaries))
+        stops = np.concatenate((boundaries, [len(df)]))
+        groups = {
+            group_values[start]: [int(start), int(stop)]
+            for start, stop in zip(starts, stops)
+        }
+
+    manifest = {
+        "n_rows": int(len(df)),
+        "categorical_features": list(categorical_features),
+        "numeric_features": list(numeric_features),
+        "target": target,
+        "group_column": group_column,
+        "date_column": date_column,
+        "categories": categories,
+        "groups": groups,
+        "files": ARRAY_FILES,
+    }
+    with open(output_dir / MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    return manifest
+
+
+def load_training_matrices(export_dir, mmap_mode="r"):
+    """
+    Attach to exported training matrices without reading them into memory.
+
+    Args:
+    export_dir (str or Path): Directory written by export_training_matrices
+    mmap_mode (str): numpy memory-map mode; "r" shares the OS page cache
+        between every worker process that opens the same files
+
+    Returns:
+    dict: Memory-mapped arrays keyed by name, plus the "manifest" dict
+    """
+    export_dir = Path(export_dir)
+    with open(export_dir / MANIFEST_FILE, encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    matrices = {
+        name: np.load(export_dir / file_name, mmap_mode=mmap_mode)
+        for name, file_name in manifest["files"].items()
+    }
+    matrices["manifest"] = manifest
+    return matrices
+
+
+def group_rows(matrices, group):
+    """
+    Row range of a single group (geounit) as a slice.
+
+    Args:
+    matrices (dict): Output of load_training_matrices
+    group (str): Group value, e.g. "APG"
+
+    Returns:
+    slice: Contiguous row range for the group
+    """
+    groups = matrices["manifest"]["groups"]
+    if group not in groups:
+        raise ValueError(
+            f"Unknown group {group!r}; exported groups: {', '.join(groups)}"
+        )
+    start, stop = groups[group]
+    return slice(start, stop)
+
+
+def date_split(matrices, end, rows):
+    """
+    Split a group's row range into rows dated on or before end and rows after it.
+    Rows within a group are sorted by date, so both parts are zero-copy slices.
+
+    Args:
+    matrices (dict): Output of load_training_matrices
+    end (str or pd.Timestamp): Last date of the first part
+    rows (slice): Row range of a single group, e.g. group_rows(...)
+
+    Returns:
+    tuple: (slice of rows <= end, slice of rows > end)
+    """
+    dates = matrices["dates"][rows]
+    split = rows.start + int(
+        np.searchsorted(dates, np.datetime64(pd.Timestamp(end)), side="right")
+    )
+    return slice(rows.start, split), slice(split, rows.stop)
+
+
+def to_feature_frame(matrices, rows=slice(None)):
+    """
+    Build a feature dataframe for the given rows, ready to pass to CatBoost.
+    Categorical features are kept as their integer codes, which CatBoost
+    accepts as cat_features; only the requested rows are materialised.
+
+    Args:
+    matrices (dict): Output of load_training_matrices
+    rows (slice or np.ndarray): Rows to take
+
+    Returns:
+    tuple: (X as pd.DataFrame, y as np.ndarray, categorical feature names)
+    """
+    manifest = matrices["manifest"]
+    categorical_features = manifest["categorical_features"]
+    numeric_features = manifest["numeric_features"]
+
+    cat_codes = matrices["cat_codes"][rows]
+    numeric = matrices["numeric"][rows]
+
+    columns = {
+        feature: cat_codes[:, i] for i, feature in enumerate(categorical_features)
+    }
+    columns.update(
+        {feature: numeric[:, i] for i, feature in enumerate(numeric_features)}
+    )
+    X = pd.DataFrame(columns, copy=False)
+
+    return X, np.asarray(matrices["labels"][rows]), categorical_features
+
+
+def encode_features(df, manifest):
+    """
+    Encode a processed tickets dataframe with the categories of an export, so
+    rows read from CSV match the integer codes a model was trained on.
+    Categories not seen in the export are encoded as -1.
+
+    Args:
+    df (pd.DataFrame): Processed tickets dataframe
+    manifest (dict): Manifest of the export the model was trained on
+
+    Returns:
+    pd.DataFrame: Features in the same layout as to_feature_frame
+    """
+    columns = {
+        feature: pd.Index(manifest["categories"][feature])
+        .get_indexer(df[feature].fillna("Unknown").astype(str))
+        .astype(np.int32)
+        for feature in manifest["categorical_features"]
+    }
+    columns.update(
+        {
+            feature: df[feature].to_numpy(dtype=np.float64)
+            for feature in manifest["numeric_features"]
+        }
+    )
+    return pd.DataFrame(columns, index=df.index)
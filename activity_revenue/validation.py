@@ -0,0 +1,306 @@
+# activity_revenue/validation.py
+
+import json
+import math
+
+
+# Thresholds that fail the run when exceeded; None records the metric only
+DEFAULT_THRESHOLDS = {
+    # Fraction of nulls in any NULL_CHECK_COLUMNS column before clean_data
+    "max_null_fraction": 0.05,
+    # Fraction of tickets whose end date is before the start date or missing
+    "max_invalid_date_fraction": 0.01,
+    # Fraction of tickets whose Activity ID has no journal Value
+    "max_missing_journal_fraction": None,
+    # Absolute USD difference between total revenue before and after grouping
+    "max_revenue_difference": 1.0,
+    # Fraction of grouped rows with zero revenue
+    "max_zero_revenue_fraction": None,
+    # Absolute % difference between tickets and RPE revenue per geounit/month
+    "max_rpe_difference_pct": None,
+}
+
+# Raw ticket columns read by the tickets pipeline, checked for nulls before cleaning
+NULL_CHECK_COLUMNS = [
+    "Sl Geounit (Code)",
+    "Country Name",
+    "Job Group code",
+    "Job Type code",
+    "Billing Account",
+    "Rig Name",
+    "Rig type",
+    "Rig environment",
+    "Well type",
+    "Well Operating Environment",
+    "Activity ID",
+    "Well Name",
+    "Field Ticket USD net value",
+    "Field Ticket Start Date",
+    "Field Ticket End Date",
+]
+
+# Number of example values kept in the report for unbounded lists
+SAMPLE_SIZE = 20
+
+
+def _finite(value):
+    """
+    Replace NaN and infinite floats with None, recursively, so the report is
+    strict JSON.
+    """
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_finite(item) for item in value]
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+class DataValidationError(Exception):
+    """
+    Raised when a validation check exceeds its configured threshold.
+    """
+
+    def __init__(self, failures):
+        self.failures = failures
+        super().__init__("Data validation failed: " + "; ".join(failures))
+
+
+class ValidationReport:
+    """
+    Accumulates data-quality metrics while the pipeline runs.
+
+    Every record_* method takes reductions (counts and sums) that the stages
+    compute on data they already hold, so validation adds no extra passes.
+    Partial reports built over chunks of the data can be combined with merge(),
+    which adds up the row-level counts and revenue totals. Grouped-row counts
+    are not additive across chunks (a group can span several chunks), so
+    record_zero_revenue must be called once on the combined grouped result.
+    """
+
+    def __init__(self, thresholds=None):
+        self.thresholds = dict(DEFAULT_THRESHOLDS)
+        if thresholds:
+            self.thresholds.update(thresholds)
+
+        self.null_counts = {}
+        self.null_rows = 0
+        self.date_rows = 0
+        self.invalid_date_ranges = 0
+        self.missing_dates = 0
+        self.journal_rows = 0
+        self.rows_missing_journal = 0
+        self.activity_ids_missing_journal = set()
+        self.revenue_before = None
+        self.revenue_after = None
+        self.grouped_rows = 0
+        self.zero_revenue_rows = 0
+        self.rpe_breaches = []
+        self.rpe_cells = 0
+
+    def record_nulls(self, null_counts, rows):
+        """
+        Args:
+        null_counts (dict or pd.Series): Null count per column, e.g. df.isna().sum()
+        rows (int): Number of rows the counts were taken over
+        """
+        for column, count in dict(null_counts).items():
+            self.null_counts[column] = self.null_counts.get(column, 0) + int(count)
+        self.null_rows += int(rows)
+
+    def record_date_ranges(self, invalid, missing, rows):
+        """
+        Args:
+        invalid (int): Tickets whose end date is before their start date
+        missing (int): Tickets with a missing start or end date
+        rows (int): Number of tickets checked
+        """
+        self.invalid_date_ranges += int(invalid)
+        self.missing_dates += int(missing)
+        self.date_rows += int(rows)
+
+    def record_journal_matches(self, missing_rows, missing_activity_ids, rows):
+        """
+        Args:
+        missing_rows (int): Tickets without a journal Value
+        missing_activity_ids (iterable): Distinct Activity IDs without a journal Value
+        rows (int): Number of tickets checked
+        """
+        self.rows_missing_journal += int(missing_rows)
+        self.activity_ids_missing_journal.update(missing_activity_ids)
+        self.journal_rows += int(rows)
+
+    def record_revenue(self, before=None, after=None):
+        """
+        Args:
+        before (float): Total ticket revenue before grouping
+        after (float): Total ticket revenue after grouping
+        """
+        if before is not None:
+            self.revenue_before = (self.revenue_before or 0.0) + float(before)
+        if after is not None:
+            self.revenue_after = (self.revenue_after or 0.0) + float(after)
+
+    def record_zero_revenue(self, zero_rows, rows):
+        """
+        Args:
+        zero_rows (int): Grouped rows with zero revenue
+        rows (int): Number of grouped rows
+        """
+        self.zero_revenue_rows += int(zero_rows)
+        self.grouped_rows += int(rows)
+
+    def record_rpe_reconciliation(self, reconciliation_df):
+        """
+        Record geounit/month cells whose tickets revenue differs from RPE revenue
+        by more than max_rpe_difference_pct. Cells with RPE revenue but no
+        tickets revenue always breach; their difference_pct is None.
+
+        Args:
+        reconciliation_df (pd.DataFrame): Output of reconcile_revenue
+        """
+        self.rpe_cells += len(reconciliation_df)
+        limit = self.thresholds["max_rpe_difference_pct"]
+        if limit is None:
+            return
+
+        difference_pct = reconciliation_df["Difference %"]
+        no_tickets_revenue = difference_pct.isna() & (
+            reconciliation_df["RPE Revenue"] != 0
+        )
+        breaches = reconciliation_df[(difference_pct.abs() > limit) | no_tickets_revenue]
+        for row in breaches.to_dict("records"):
+            self.rpe_breaches.append(
+                {
+                    "geounit": row["Geounit"],
+                    "month": str(row["Date"].date()),
+                    "tickets_revenue": float(row["Tickets Revenue"]),
+                    "rpe_revenue": float(row["RPE Revenue"]),
+                    "difference_pct": _finite(row["Difference %"]),
+                }
+            )
+
+    def merge(self, other):
+        """
+        Combine the row-level metrics of a partial report (e.g. from another chunk)
+        into this one. Zero-revenue group counts are not merged; see the class
+        docstring.
+        """
+        self.record_nulls(other.null_counts, other.null_rows)
+        self.record_date_ranges(
+            other.invalid_date_ranges, other.missing_dates, other.date_rows
+        )
+        self.record_journal_matches(
+            other.rows_missing_journal,
+            other.activity_ids_missing_journal,
+            other.journal_rows,
+        )
+        self.record_revenue(other.revenue_before, other.revenue_after)
+        self.rpe_breaches.extend(other.rpe_breaches)
+        self.rpe_cells += other.rpe_cells
+        return self
+
+    def _checks(self):
+        """
+        Metric and threshold of each check that has data recorded.
+        """
+        checks = {}
+        if self.null_rows:
+            fractions = {
+                column: count / self.null_rows
+                for column, count in self.null_counts.items()
+            }
+            worst = max(fractions, key=fractions.get) if fractions else None
+            checks["null_fraction"] = {
+                "value": fractions[worst] if worst else 0.0,
+                "column": worst,
+                "threshold": self.thresholds["max_null_fraction"],
+            }
+        if self.date_rows:
+            checks["invalid_date_fraction"] = {
+                "value": (self.invalid_date_ranges + self.missing_dates)
+                / self.date_rows,
+                "threshold": self.thresholds["max_invalid_date_fraction"],
+            }
+        if self.journal_rows:
+            checks["missing_journal_fraction"] = {
+                "value": self.rows_missing_journal / self.journal_rows,
+                "threshold": self.thresholds["max_missing_journal_fraction"],
+            }
+        if self.revenue_before is not None and self.revenue_after is not None:
+            checks["revenue_difference"] = {
+                "value": abs(self.revenue_before - self.revenue_after),
+                "threshold": self.thresholds["max_revenue_difference"],
+            }
+        if self.grouped_rows:
+            checks["zero_revenue_fraction"] = {
+                "value": self.zero_revenue_rows / self.grouped_rows,
+                "threshold": self.thresholds["max_zero_revenue_fraction"],
+            }
+        if self.rpe_cells and self.thresholds["max_rpe_difference_pct"] is not None:
+            checks["rpe_breaches"] = {"value": len(self.rpe_breaches), "threshold": 0}
+
+        for check in checks.values():
+            value, threshold = check["value"], check["threshold"]
+            check["passed"] = threshold is None or not (
+                value > threshold or math.isnan(value)
+            )
+        return checks
+
+    def failures(self):
+        """
+        Describe every check that exceeded its threshold.
+        """
+        return [
+            f"{name} = {check['value']:.6g} exceeds {check['threshold']}"
+            + (f" (column {check['column']!r})" if check.get("column") else "")
+            for name, check in self._checks().items()
+            if not check["passed"]
+        ]
+
+    def to_dict(self):
+        """
+        Machine-readable report of the recorded metrics and check outcomes.
+        """
+        checks = self._checks()
+        return {
+            "passed": all(check["passed"] for check in checks.values()),
+            "checks": checks,
+            "metrics": {
+                "null_counts": self.null_counts,
+                "null_rows": self.null_rows,
+                "invalid_date_ranges": self.invalid_date_ranges,
+                "missing_dates": self.missing_dates,
+                "date_rows": self.date_rows,
+                "rows_missing_journal": self.rows_missing_journal,
+                "activity_ids_missing_journal": len(
+                    self.activity_ids_missing_journal
+                ),
+                "activity_ids_missing_journal_sample": sorted(
+                    map(str, self.activity_ids_missing_journal)
+                )[:SAMPLE_SIZE],
+                "journal_rows": self.journal_rows,
+                "revenue_before": self.revenue_before,
+                "revenue_after": self.revenue_after,
+                "zero_revenue_rows": self.zero_revenue_rows,
+                "grouped_rows": self.grouped_rows,
+                "rpe_cells": self.rpe_cells,
+                "rpe_breaches": self.rpe_breaches,
+            },
+            "thresholds": self.thresholds,
+        }
+
+    def write_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                _finite(self.to_dict()), f, indent=2, default=str, allow_nan=False
+            )
+
+    def raise_for_failures(self):
+        """
+        Raise DataValidationError if any check exceeded its threshold.
+        """
+        failures = self.failures()
+        if failures:
+            raise DataValidationError(failures)
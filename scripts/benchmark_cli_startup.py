@@ -0,0 +1,155 @@
+import argparse
+import csv
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[1]
+
+# Modules that must not be imported just to parse the command line
+HEAVY_MODULES = [
+    "pandas",
+    "numpy",
+    "duckdb",
+    "catboost",
+    "optuna",
+    "scipy",
+    "sklearn",
+    "matplotlib",
+    "seaborn",
+]
+
+COMMANDS = {
+    "--help": ["-m", "activity_revenue", "--help"],
+    "tickets --help": ["-m", "activity_revenue", "tickets", "--help"],
+}
+
+# Heavy modules a real run of the lightweight subcommand may load
+RECONCILE_MODULES = ["pandas", "numpy"]
+
+
+def write_reconcile_fixture(fixture_dir):
+    """
+    Write tiny processed tickets and RPE files and return the reconcile
+    arguments that read them.
+    """
+    tickets_path = fixture_dir / "tickets.csv"
+    rpe_path = fixture_dir / "rpe.csv"
+    with open(tickets_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Sl Geounit (Code)", "Adjusted Date", "Tickets_Revenue"])
+        writer.writerow(["APG", "2023-01-01", 100.0])
+        writer.writerow(["QTG", "2023-02-01", 50.0])
+    with open(rpe_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            [
+                "SL Geounit (Code)",
+                "Month Date",
+                "RPE Revenue",
+                "SL Sub Business Line (Code)",
+                "GL Account Category",
+            ]
+        )
+        writer.writerow(["APG", "2023-01-01", 110.0, "WLES", "Service Revenue"])
+        writer.writerow(["QTG", "2023-02-01", 45.0, "WLES", "Service Revenue"])
+    return [
+        "reconcile",
+        "--tickets",
+        str(tickets_path),
+        "--rpe",
+        str(rpe_path),
+        "--output",
+        str(fixture_dir / "reconciliation.csv"),
+        "--validation-report",
+        str(fixture_dir / "report.json"),
+    ]
+
+
+def time_command(args, repeat):
+    """
+    Median wall-clock time of running the interpreter with the given arguments.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *args],
+            cwd=project_root,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def heavy_imports(argv=None):
+    """
+    Heavy modules loaded by importing the CLI module or, with argv, by
+    running the CLI with those arguments.
+    """
+    lines = ["import contextlib, io, sys", "import activity_revenue.cli"]
+    if argv is not None:
+        lines += [
+            "with contextlib.redirect_stdout(io.StringIO()):",
+            f"    activity_revenue.cli.main({argv!r})",
+        ]
+    lines.append(f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    code = "\n".join(lines)
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=project_root,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return [m for m in result.stdout.strip().split(",") if m]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure CLI cold-start time.")
+    parser.add_argument("--repeat", type=int, default=10, help="Runs per command")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        reconcile_argv = write_reconcile_fixture(Path(tmp_dir))
+        commands = dict(COMMANDS)
+        commands["reconcile (tiny fixture)"] = [
+            "-m",
+            "activity_revenue",
+            *reconcile_argv,
+        ]
+
+        baseline = time_command(["-c", "pass"], args.repeat)
+        print(f"Bare interpreter: {baseline * 1000:.0f} ms")
+        for name, command in commands.items():
+            elapsed = time_command(command, args.repeat)
+            print(
+                f"activity-revenue {name}: {elapsed * 1000:.0f} ms "
+                f"(+{(elapsed - baseline) * 1000:.0f} ms over bare interpreter)"
+            )
+
+        failed = False
+        heavy = heavy_imports()
+        if heavy:
+            print(f"\nHeavy modules imported at startup: {', '.join(heavy)}")
+            failed = True
+        else:
+            print("\nNo heavy modules imported at startup")
+
+        heavy = heavy_imports(reconcile_argv)
+        print(f"Heavy modules imported by reconcile: {', '.join(heavy) or 'none'}")
+        unexpected = [m for m in heavy if m not in RECONCILE_MODULES]
+        if unexpected:
+            print(f"Unexpected for reconcile: {', '.join(unexpected)}")
+            failed = True
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+import argparse
+import multiprocessing
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from activity_revenue.model import load_and_preprocess_data
+from activity_revenue.training_matrices import (
+    CATEGORICAL_FEATURES,
+    NUMERIC_FEATURES,
+    TARGET,
+    export_training_matrices,
+    group_rows,
+    load_training_matrices,
+    to_feature_frame,
+)
+
+MODES = ["idle", "csv", "mmap"]
+
+
+def generate_processed_tickets(n_rows, n_geounits, seed=0):
+    """
+    Generate random rows with the processed tickets layout.
+    """
+    rng = np.random.default_rng(seed)
+
+    def choice(prefix, n_values):
+        values = np.array([f"{prefix}{i}" for i in range(n_values)], dtype=object)
+        return rng.choice(values, n_rows)
+
+    df = pd.DataFrame(
+        {
+            "Adjusted Date": pd.Timestamp("2022-01-01")
+            + pd.to_timedelta(rng.integers(0, 36, n_rows) * 30, unit="D"),
+        }
+    )
+    df["Sl Geounit (Code)"] = choice("GEO", n_geounits)
+    for i, feature in enumerate(CATEGORICAL_FEATURES[1:]):
+        df[feature] = choice(f"C{i}_", 50)
+    for feature in NUMERIC_FEATURES:
+        df[feature] = rng.random(n_rows) * 30
+    df[TARGET] = rng.gamma(2.0, 10000.0, n_rows)
+    return df
+
+
+def memory_usage():
+    """
+    Resident (Rss), proportional (Pss) and peak resident (VmHWM) memory of this
+    process in MB. Pss splits shared pages, e.g. a memory-mapped file, evenly
+    between the processes that map them, so summing it over processes does not
+    double-count.
+    """
+    usage = {}
+    with open("/proc/self/smaps_rollup", encoding="utf-8") as f:
+        for line in f:
+            name, _, value = line.partition(":")
+            if name in ("Rss", "Pss"):
+                usage[name] = int(value.split()[0]) / 1024
+    with open("/proc/self/status", encoding="utf-8") as f:
+        for line in f:
+            name, _, value = line.partition(":")
+            if name == "VmHWM":
+                usage[name] = int(value.split()[0]) / 1024
+    return usage
+
+
+def worker(mode, csv_path, matrices_dir, geounit, barrier, results):
+    """
+    Load one geounit's features the way a per-geounit training worker would,
+    then report memory once every worker holds its data.
+    """
+    if mode == "csv":
+        df = load_and_preprocess_data(csv_path, geounits=[geounit])
+        X, y = df[CATEGORICAL_FEATURES + NUMERIC_FEATURES], df[TARGET].to_numpy()
+    elif mode == "mmap":
+        matrices = load_training_matrices(matrices_dir)
+        X, y, _ = to_feature_frame(matrices, group_rows(matrices, geounit))
+    else:
+        X, y = pd.DataFrame(), np.empty(0)
+    # Read every feature value, as training would
+    checksum = float(pd.util.hash_pandas_object(X, index=False).sum())
+    checksum += float(y.sum())
+
+    barrier.wait()
+    results.put(
+        {"geounit": geounit, "rows": len(X), "checksum": checksum, **memory_usage()}
+    )
+    barrier.wait()
+
+
+def measure(mode, n_workers, csv_path, matrices_dir, geounits):
+    """
+    Run n_workers concurrent workers, each on its own geounit, and collect
+    their memory usage while all of them are alive.
+    """
+    # spawn gives every worker a fresh interpreter, as separate training jobs would have
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(n_workers)
+    results = context.Queue()
+    processes = [
+        context.Process(
+            target=worker,
+            args=(
+                mode,
+                csv_path,
+                matrices_dir,
+                geounits[i % len(geounits)],
+                barrier,
+                results,
+            ),
+        )
+        for i in range(n_workers)
+    ]
+    for process in processes:
+        process.start()
+    usages = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return usages
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure worker memory with CSV re-reads vs memory-mapped matrices."
+    )
+    parser.add_argument(
+        "--rows", type=int, default=1_000_000, help="Synthetic processed tickets rows"
+    )
+    parser.add_argument("--geounits", type=int, default=8, help="Synthetic geounits")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8],
+        help="Worker counts to measure",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = Path(tmp_dir) / "processed_tickets.csv"
+        matrices_dir = Path(tmp_dir) / "training_matrices"
+
+        print(f"Generating {args.rows:,} synthetic rows in {args.geounits} geounits...")
+        df = generate_processed_tickets(args.rows, args.geounits)
+        df.to_csv(csv_path, index=False)
+        manifest = export_training_matrices(df, matrices_dir)
+        geounits = list(manifest["groups"])
+        del df
+
+        print(f"CSV: {csv_path.stat().st_size / 2**20:,.0f} MB")
+        matrices_size = sum(p.stat().st_size for p in matrices_dir.glob("*.npy"))
+        print(f"Matrices: {matrices_size / 2**20:,.0f} MB")
+        print(
+            "\nTotal Pss is the memory all workers use together; 'data' subtracts "
+            "the interpreter and imports (the idle workers' Pss)."
+        )
+        print(
+            f"\n{'workers':>7} {'mode':>5} {'total Pss MB':>13} {'data MB':>8} "
+            f"{'peak Rss/worker MB':>19}"
+        )
+
+        for n_workers in args.workers:
+            idle_pss = sum(
+                u["Pss"]
+                for u in measure("idle", n_workers, csv_path, matrices_dir, geounits)
+            )
+            for mode in MODES[1:]:
+                usages = measure(mode, n_workers, csv_path, matrices_dir, geounits)
+                total_pss = sum(u["Pss"] for u in usages)
+                peak_rss = max(u["VmHWM"] for u in usages)
+                print(
+                    f"{n_workers:>7} {mode:>5} {total_pss:>13,.0f} "
+                    f"{total_pss - idle_pss:>8,.0f} {peak_rss:>19,.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
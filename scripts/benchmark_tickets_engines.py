@@ -0,0 +1,195 @@
+import argparse
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from activity_revenue.duckdb_engine import process_tickets_duckdb
+from activity_revenue.tickets import process_tickets_pandas
+
+project_root = Path(__file__).resolve().parents[1]
+
+
+def scale_data(tickets_df, journal_df, scale):
+    """
+    Replicate tickets and journal data `scale` times.
+    Each copy gets its own Activity IDs so Ticket_Count per activity is unchanged.
+    """
+    tickets_copies = []
+    journal_copies = []
+    for k in range(scale):
+        tickets_copy = tickets_df.copy()
+        journal_copy = journal_df.copy()
+        if k > 0:
+            tickets_copy["Activity ID"] = (
+                tickets_copy["Activity ID"].astype(str) + f"_{k}"
+            )
+            journal_copy["Activity ID"] = (
+                journal_copy["Activity ID"].astype(str) + f"_{k}"
+            )
+        tickets_copies.append(tickets_copy)
+        journal_copies.append(journal_copy)
+    return (
+        pd.concat(tickets_copies, ignore_index=True),
+        pd.concat(journal_copies, ignore_index=True),
+    )
+
+
+def generate_synthetic_data(n_tickets, seed=0):
+    """
+    Generate random tickets and journal data with the raw file layout.
+    """
+    rng = np.random.default_rng(seed)
+    n_activities = max(n_tickets // 3, 1)
+    activity_ids = np.array([f"ACT{i:07d}" for i in range(n_activities)])
+
+    def choice(prefix, n_values):
+        values = np.array([f"{prefix}{i}" for i in range(n_values)], dtype=object)
+        column = rng.choice(values, n_tickets)
+        column[rng.random(n_tickets) < 0.02] = None
+        return column
+
+    # Raw end dates carry a time of day, e.g. "2021-12-26 04:59:00"
+    end_dates = pd.Timestamp("2022-10-01") + pd.to_timedelta(
+        rng.integers(0, 640 * 24 * 60, n_tickets), unit="min"
+    )
+    start_dates = end_dates - pd.Timedelta(days=3)
+    # A few tickets end before they start or have no end date
+    start_dates = start_dates.where(
+        rng.random(n_tickets) > 0.01, end_dates + pd.Timedelta(days=1)
+    )
+    end_dates = end_dates.where(rng.random(n_tickets) > 0.005)
+
+    tickets_df = pd.DataFrame(
+        {
+            "Sl Geounit (Code)": rng.choice(["APG", "QTG", "ECP", "NAO"], n_tickets),
+            "Country Name": choice("Country", 30),
+            "Job Group code": choice("JG", 5),
+            "Job Type code": choice("JT", 20),
+            "Activity ID": rng.choice(activity_ids, n_tickets),
+            "Field Ticket ID": [f"FT{i:08d}" for i in range(n_tickets)],
+            "Well Name": choice("Well", n_tickets // 2 + 1),
+            "Rig Name": choice("Rig", 200),
+            "Rig type": choice("RT", 6),
+            "Rig environment": choice("RE", 3),
+            "Well type": choice("WT", 5),
+            "Well Operating Environment": choice("WOE", 3),
+            "Billing Account": choice("BA", 100),
+            "Field Ticket Start Date": start_dates.strftime("%Y-%m-%d %H:%M:%S"),
+            "Field Ticket End Date": end_dates.strftime("%Y-%m-%d %H:%M:%S"),
+            "Field Ticket USD net value": np.where(
+                rng.random(n_tickets) < 0.01,
+                np.nan,
+                rng.gamma(2.0, 20000.0, n_tickets).round(2),
+            ),
+        }
+    )
+    journal_ids = rng.choice(activity_ids, int(n_activities * 0.9), replace=False)
+    journal_df = pd.DataFrame(
+        {
+            "Geounit": "APG",
+            "Activity ID": journal_ids,
+            "OA Start": "2023-01-01",
+            "OA End": "2023-01-31",
+            "Value": rng.integers(1, 60, len(journal_ids)),
+        }
+    )
+    return tickets_df, journal_df
+
+
+def check_parity(pandas_df, duckdb_df):
+    """
+    Raise an AssertionError if the two engines disagree.
+    """
+    pandas_df = pandas_df.reset_index(drop=True)
+    duckdb_df = duckdb_df.reset_index(drop=True)
+    pd.testing.assert_frame_equal(
+        pandas_df, duckdb_df, check_dtype=False, check_exact=False, rtol=1e-9
+    )
+
+
+def time_engine(engine, tickets_path, journal_path):
+    start = time.perf_counter()
+    with redirect_stdout(StringIO()):
+        result = engine(tickets_path, journal_path)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check parity and benchmark the pandas and DuckDB tickets engines."
+    )
+    parser.add_argument(
+        "--scale",
+        type=int,
+        default=10,
+        help="Replication factor applied to the input data",
+    )
+    parser.add_argument(
+        "--synthetic-rows",
+        type=int,
+        default=None,
+        help="Use this many synthetic ticket rows instead of the raw data files",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["csv", "parquet"],
+        default="csv",
+        help="File format the scaled inputs are written in",
+    )
+    args = parser.parse_args()
+
+    if args.synthetic_rows is not None:
+        print(f"Generating {args.synthetic_rows} synthetic ticket rows...")
+        tickets_df, journal_df = generate_synthetic_data(args.synthetic_rows)
+    else:
+        print("Loading raw tickets and processed journal data...")
+        tickets_df = pd.read_csv(
+            project_root / "raw_data" / "global_tickets_wles_ops_data.csv"
+        )
+        journal_df = pd.read_csv(
+            project_root / "processed_data" / "processed_journal_operatingtime.csv"
+        )
+
+    tickets_df, journal_df = scale_data(tickets_df, journal_df, args.scale)
+    print(f"Scaled to {len(tickets_df)} tickets and {len(journal_df)} journal rows")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tickets_path = Path(tmp_dir) / f"tickets.{args.format}"
+        journal_path = Path(tmp_dir) / f"journal.{args.format}"
+        if args.format == "parquet":
+            tickets_df.to_parquet(tickets_path, index=False)
+            journal_df.to_parquet(journal_path, index=False)
+        else:
+            tickets_df.to_csv(tickets_path, index=False)
+            journal_df.to_csv(journal_path, index=False)
+        del tickets_df, journal_df
+
+        if args.format == "parquet":
+            print("Skipping pandas engine: it reads CSV only")
+            duckdb_df, duckdb_time = time_engine(
+                process_tickets_duckdb, tickets_path, journal_path
+            )
+            print(f"\nDuckDB engine: {duckdb_time:.2f}s ({len(duckdb_df)} rows)")
+            return
+
+        pandas_df, pandas_time = time_engine(
+            process_tickets_pandas, tickets_path, journal_path
+        )
+        duckdb_df, duckdb_time = time_engine(
+            process_tickets_duckdb, tickets_path, journal_path
+        )
+
+    check_parity(pandas_df, duckdb_df)
+    print(f"\nParity check passed ({len(pandas_df)} grouped rows)")
+    print(f"pandas engine: {pandas_time:.2f}s")
+    print(f"DuckDB engine: {duckdb_time:.2f}s")
+    print(f"Speed-up: {pandas_time / duckdb_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+# scripts/export_training_matrices.py
+#
+# Equivalent to `activity-revenue export-matrices` run from the project root.
+
+import sys
+from pathlib import Path
+
+from activity_revenue.cli import main
+
+# Default data paths are resolved against the project root
+project_root = Path(__file__).resolve().parents[1]
+
+
+if __name__ == "__main__":
+    main(["--data-root", str(project_root), "export-matrices", *sys.argv[1:]])
@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from activity_revenue.tickets import process_tickets_duckdb, process_tickets_pandas
+
+pytest.importorskip("duckdb")
+
+
+def write_fixture(tmp_path, numeric_ids=False):
+    tickets_df = pd.DataFrame(
+        {
+            "Sl Geounit (Code)": ["APG"] * 3 + ["QTG"] * 3 + ["APG", "QTG"],
+            "Country Name": ["A", None, "A", "B", "B", None, "A", "B"],
+            "Job Group code": ["JG1"] * 8,
+            "Job Type code": ["JT1", "JT1", None, "JT2", "JT2", "JT2", "JT1", "JT2"],
+            "Billing Account": ["BA1", "BA1", "BA2", None, "BA2", "BA2", "BA1", "BA2"],
+            "Rig Name": ["R1", "R1", "R2", "R3", None, "R3", "R1", "R3"],
+            "Rig type": ["LAND"] * 8,
+            "Rig environment": ["ONSHORE"] * 8,
+            "Well type": ["DEV"] * 8,
+            "Well Operating Environment": ["LAND"] * 8,
+            # ACT9 and the missing Activity ID have no journal Value
+            "Activity ID": [
+                "ACT1",
+                "ACT1",
+                "ACT2",
+                "ACT3",
+                "ACT9",
+                "ACT3",
+                "ACT2",
+                None,
+            ],
+            "Well Name": ["W1", "W2", "W1", None, "W3", "W3", "W2", "W4"],
+            "Field Ticket USD net value": [
+                100.0,
+                250.5,
+                np.nan,
+                75.25,
+                40.0,
+                10.0,
+                5.0,
+                20.0,
+            ],
+            "Field Ticket Start Date": [
+                "2023-01-20 08:00:00",
+                "2023-01-24 08:00:00",
+                "2023-02-10 06:30:00",
+                # Ends before it starts
+                "2023-03-05 00:00:00",
+                "2023-03-20 12:00:00",
+                "2023-03-28 09:00:00",
+                "2023-04-01 00:00:00",
+                "2023-04-03 00:00:00",
+            ],
+            "Field Ticket End Date": [
+                "2023-01-25 23:59:00",
+                "2023-01-26 00:30:00",
+                "2023-02-12 18:00:00",
+                "2023-03-01 10:00:00",
+                "2023-03-27 12:00:00",
+                "2023-03-31 17:45:00",
+                # Missing end date
+                None,
+                "2023-04-04 15:00:00",
+            ],
+        }
+    )
+    journal_df = pd.DataFrame(
+        {
+            "Geounit": ["APG", "APG", "QTG"],
+            "Activity ID": ["ACT1", "ACT2", "ACT3"],
+            "Value": [4, 3, 10],
+            "OA Start": ["2023-01-01"] * 3,
+            "OA End": ["2023-01-31"] * 3,
+        }
+    )
+    if numeric_ids:
+        # Read back as float in the tickets file because of the missing ID
+        tickets_df["Activity ID"] = tickets_df["Activity ID"].str[3:].astype("Int64")
+        journal_df["Activity ID"] = journal_df["Activity ID"].str[3:].astype(int)
+
+    tickets_path = tmp_path / "tickets.csv"
+    journal_path = tmp_path / "journal.csv"
+    tickets_df.to_csv(tickets_path, index=False)
+    journal_df.to_csv(journal_path, index=False)
+    return tickets_path, journal_path
+
+
+@pytest.mark.parametrize("numeric_ids", [False, True])
+def test_duckdb_engine_matches_pandas(tmp_path, numeric_ids):
+    tickets_path, journal_path = write_fixture(tmp_path, numeric_ids)
+
+    pandas_df = process_tickets_pandas(tickets_path, journal_path)
+    duckdb_df = process_tickets_duckdb(tickets_path, journal_path)
+
+    assert len(pandas_df) == 7
+    pd.testing.assert_frame_equal(
+        pandas_df.reset_index(drop=True),
+        duckdb_df.reset_index(drop=True),
+        check_dtype=False,
+        check_exact=False,
+        rtol=1e-9,
+    )
@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from activity_revenue.model import split_rows
+from activity_revenue.training_matrices import (
+    date_split,
+    encode_features,
+    export_training_matrices,
+    group_rows,
+    load_training_matrices,
+    to_feature_frame,
+)
+
+
+def make_processed_tickets(n_rows=200, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "Adjusted Date": pd.Timestamp("2023-01-01")
+            + pd.to_timedelta(rng.integers(0, 24, n_rows) * 31, unit="D"),
+            "Sl Geounit (Code)": rng.choice(["APG", "QTG", "EGY"], n_rows),
+            "Country Name": rng.choice(["A", "B", None], n_rows),
+            "Job Group code": "JG1",
+            "Job Type code": rng.choice(["JT1", "JT2"], n_rows),
+            "Billing Account": rng.choice(["BA1", "BA2"], n_rows),
+            "Rig Name": rng.choice(["R1", "R2", "R3"], n_rows),
+            "Rig type": "LAND",
+            "Rig environment": "ONSHORE",
+            "Well type": "DEV",
+            "Well Operating Environment": "LAND",
+            "Unique_Well_Count": rng.integers(1, 5, n_rows),
+            "Operating Days": rng.random(n_rows) * 30,
+            "Operating_CellMonth": rng.random(n_rows),
+            "Tickets_Revenue": rng.gamma(2.0, 1000.0, n_rows),
+        }
+    )
+    df["Adjusted Date"] = df["Adjusted Date"].dt.to_period("M").dt.to_timestamp()
+    return df
+
+
+def test_split_rows_match_dates(tmp_path):
+    df = make_processed_tickets()
+    export_training_matrices(df, tmp_path)
+    matrices = load_training_matrices(tmp_path)
+    train_end = np.datetime64("2023-12-31")
+
+    train_rows, test_rows = date_split(
+        matrices, "2023-12-31", group_rows(matrices, "APG")
+    )
+    assert isinstance(train_rows, slice) and isinstance(test_rows, slice)
+    assert (matrices["dates"][train_rows] <= train_end).all()
+    assert (matrices["dates"][test_rows] > train_end).all()
+
+    with pytest.raises(ValueError, match="Unknown group 'XXX'"):
+        split_rows(matrices, "2023-12-31", ["APG", "XXX"])
+
+    train_rows, test_rows = split_rows(matrices, "2023-12-31")
+    assert len(train_rows) == (df["Adjusted Date"] <= "2023-12-31").sum()
+    assert len(test_rows) == (df["Adjusted Date"] > "2023-12-31").sum()
+    assert np.isclose(
+        matrices["labels"][train_rows].sum() + matrices["labels"][test_rows].sum(),
+        df["Tickets_Revenue"].sum(),
+    )
+
+
+def test_encode_features_matches_exported_codes(tmp_path):
+    df = make_processed_tickets()
+    manifest = export_training_matrices(df, tmp_path)
+    matrices = load_training_matrices(tmp_path)
+    X, _, _ = to_feature_frame(matrices, group_rows(matrices, "QTG"))
+
+    # Rows of a CSV re-read in any order encode to the codes the model trained on
+    csv_df = df[df["Sl Geounit (Code)"] == "QTG"].sort_values(
+        ["Adjusted Date"], kind="stable"
+    )
+    encoded = encode_features(csv_df, manifest)
+    assert list(encoded.columns) == list(X.columns)
+    np.testing.assert_array_equal(encoded.to_numpy(), np.asarray(X.to_numpy()))
+
+    unseen = csv_df.head(1).assign(**{"Rig Name": "NEW RIG"})
+    assert encode_features(unseen, manifest)["Rig Name"].tolist() == [-1]
@@ -0,0 +1,203 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from activity_revenue.reconcile import reconcile_revenue
+from activity_revenue.tickets import (
+    ENGINES,
+    clean_data,
+    group_and_aggregate_tickets_data,
+    merge_and_distribute_operating_days,
+    preprocess_tickets_data,
+)
+from activity_revenue.validation import (
+    NULL_CHECK_COLUMNS,
+    DataValidationError,
+    ValidationReport,
+)
+
+
+def make_tickets(n_tickets=60, seed=0):
+    rng = np.random.default_rng(seed)
+    end_dates = pd.Timestamp("2023-01-01") + pd.to_timedelta(
+        rng.integers(0, 120 * 24 * 60, n_tickets), unit="min"
+    )
+    start_dates = end_dates - pd.Timedelta(days=2)
+    # A few tickets end before they start, a few have no end date
+    start_dates = start_dates.where(
+        rng.random(n_tickets) > 0.1, end_dates + pd.Timedelta(days=1)
+    )
+    end_dates = end_dates.where(rng.random(n_tickets) > 0.1)
+
+    def choice(values):
+        column = rng.choice(np.array(values, dtype=object), n_tickets)
+        column[rng.random(n_tickets) < 0.1] = None
+        return column
+
+    return pd.DataFrame(
+        {
+            "Sl Geounit (Code)": rng.choice(["APG", "QTG"], n_tickets),
+            "Country Name": choice(["A", "B"]),
+            "Job Group code": choice(["JG1"]),
+            "Job Type code": choice(["JT1", "JT2"]),
+            "Billing Account": choice(["BA1", "BA2"]),
+            "Rig Name": choice(["R1", "R2", "R3"]),
+            "Rig type": choice(["LAND"]),
+            "Rig environment": choice(["ONSHORE"]),
+            "Well type": choice(["DEV"]),
+            "Well Operating Environment": choice(["LAND"]),
+            "Activity ID": rng.choice([f"ACT{i}" for i in range(15)], n_tickets),
+            "Well Name": choice(["W1", "W2", "W3", "W4"]),
+            "Field Ticket USD net value": np.where(
+                rng.random(n_tickets) < 0.1, np.nan, rng.gamma(2.0, 1000.0, n_tickets)
+            ),
+            "Field Ticket Start Date": start_dates,
+            "Field Ticket End Date": end_dates,
+        }
+    )
+
+
+def make_journal():
+    return pd.DataFrame(
+        {"Activity ID": [f"ACT{i}" for i in range(10)], "Value": np.arange(1, 11)}
+    )
+
+
+def run_stages(tickets_df, journal_df, report):
+    report.record_nulls(
+        tickets_df.isna().sum()[NULL_CHECK_COLUMNS], rows=len(tickets_df)
+    )
+    processed_df = preprocess_tickets_data(clean_data(tickets_df), report)
+    merged_df = merge_and_distribute_operating_days(processed_df, journal_df, report)
+    return group_and_aggregate_tickets_data(merged_df, report)
+
+
+def test_merged_chunk_reports_equal_single_report():
+    tickets_df = make_tickets()
+    journal_df = make_journal()
+
+    full_report = ValidationReport()
+    run_stages(tickets_df, journal_df, full_report)
+
+    merged_report = ValidationReport()
+    for chunk in np.array_split(np.arange(len(tickets_df)), 3):
+        chunk_report = ValidationReport()
+        run_stages(tickets_df.iloc[chunk], journal_df, chunk_report)
+        merged_report.merge(chunk_report)
+
+    full_metrics = full_report.to_dict()["metrics"]
+    merged_metrics = merged_report.to_dict()["metrics"]
+    for name in [
+        "null_counts",
+        "null_rows",
+        "invalid_date_ranges",
+        "missing_dates",
+        "date_rows",
+        "rows_missing_journal",
+        "activity_ids_missing_journal",
+        "activity_ids_missing_journal_sample",
+        "journal_rows",
+    ]:
+        assert merged_metrics[name] == full_metrics[name], name
+    assert merged_metrics["revenue_before"] == pytest.approx(
+        full_metrics["revenue_before"]
+    )
+    assert merged_metrics["revenue_after"] == pytest.approx(
+        full_metrics["revenue_after"]
+    )
+    assert full_metrics["invalid_date_ranges"] > 0
+    assert full_metrics["missing_dates"] > 0
+    assert full_metrics["rows_missing_journal"] > 0
+
+    # Grouped-row counts are not additive across chunks and are left out of merge
+    assert "zero_revenue_fraction" not in merged_report.to_dict()["checks"]
+
+
+@pytest.mark.parametrize("engine", ["pandas", "duckdb"])
+def test_date_and_revenue_checks(tmp_path, engine):
+    if engine == "duckdb":
+        pytest.importorskip("duckdb")
+    tickets_df = make_tickets()
+    tickets_path = tmp_path / "tickets.csv"
+    journal_path = tmp_path / "journal.csv"
+    tickets_df.to_csv(tickets_path, index=False)
+    make_journal().to_csv(journal_path, index=False)
+
+    report = ValidationReport()
+    ENGINES[engine](tickets_path, journal_path, report=report)
+    result = report.to_dict()
+
+    start = tickets_df["Field Ticket Start Date"]
+    end = tickets_df["Field Ticket End Date"]
+    missing = end.isna()
+    assert result["metrics"]["missing_dates"] == missing.sum() > 0
+    assert result["metrics"]["invalid_date_ranges"] == (end < start).sum() > 0
+    assert result["checks"]["invalid_date_fraction"]["value"] == pytest.approx(
+        (missing.sum() + (end < start).sum()) / len(tickets_df)
+    )
+
+    # Tickets without an end date have no Adjusted Date and are dropped when grouping
+    dropped_revenue = tickets_df.loc[missing, "Field Ticket USD net value"].sum()
+    assert result["checks"]["revenue_difference"]["value"] == pytest.approx(
+        dropped_revenue
+    )
+    assert not result["checks"]["revenue_difference"]["passed"]
+    assert not result["checks"]["invalid_date_fraction"]["passed"]
+
+
+def test_thresholds_fail_the_run():
+    tickets_df = make_tickets()
+    journal_df = make_journal()
+
+    report = ValidationReport({"max_invalid_date_fraction": 0.0})
+    run_stages(tickets_df, journal_df, report)
+
+    with pytest.raises(DataValidationError, match="invalid_date_fraction"):
+        report.raise_for_failures()
+    assert not report.to_dict()["passed"]
+
+    disabled = ValidationReport(
+        {
+            "max_invalid_date_fraction": None,
+            "max_null_fraction": None,
+            "max_revenue_difference": None,
+        }
+    )
+    run_stages(tickets_df, journal_df, disabled)
+    disabled.raise_for_failures()
+
+
+def test_report_is_strict_json_without_tickets_revenue(tmp_path):
+    tickets_df = pd.DataFrame(
+        {
+            "Sl Geounit (Code)": ["APG"],
+            "Adjusted Date": ["2023-01-01"],
+            "Tickets_Revenue": [100.0],
+        }
+    )
+    rpe_df = pd.DataFrame(
+        {
+            "SL Geounit (Code)": ["APG", "APG"],
+            "Month Date": pd.to_datetime(["2023-01-01", "2023-02-01"]),
+            "RPE Revenue": [100.0, 50.0],
+        }
+    )
+
+    report = ValidationReport({"max_rpe_difference_pct": 10})
+    report.record_rpe_reconciliation(reconcile_revenue(tickets_df, rpe_df))
+    report.write_json(tmp_path / "report.json")
+
+    with open(tmp_path / "report.json", encoding="utf-8") as f:
+        data = json.load(f, parse_constant=pytest.fail)
+    assert data["metrics"]["rpe_breaches"] == [
+        {
+            "geounit": "APG",
+            "month": "2023-02-01",
+            "tickets_revenue": 0.0,
+            "rpe_revenue": 50.0,
+            "difference_pct": None,
+        }
+    ]
+    assert not data["passed"]